@@ -3,16 +3,65 @@
 # Supports: Pillow as primary; optional pillow-heif, pyheif, rawpy/imageio for HEIC/RAW.
 # Exposes: open_image(path: Path) -> PIL.Image, convert_to_jpg(...), batch_convert(...)
 
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional, Tuple, Iterable, Callable, List
+import collections
+import concurrent.futures
 import logging
 import io
+import mmap
+import os
+import shutil
+import threading
 
 from PIL import Image, ImageFile, ExifTags
 
-ImageFile.LOAD_TRUNCATED_IMAGES = True
 logger = logging.getLogger("ImageToJpgApp.converter")
 
+# Pillow's truncated-image recovery is a process-global flag; keeping it on
+# permanently forces the slower error-tolerant decode path for every file.
+# Enable it only while retrying a file that failed a normal load.
+_truncated_lock = threading.Lock()
+
+@contextmanager
+def _allow_truncated():
+    """Temporarily allow Pillow to load truncated files (serialized, since
+    LOAD_TRUNCATED_IMAGES is process-global)."""
+    with _truncated_lock:
+        ImageFile.LOAD_TRUNCATED_IMAGES = True
+        try:
+            yield
+        finally:
+            ImageFile.LOAD_TRUNCATED_IMAGES = False
+
+def _log_simd_status() -> None:
+    """Log whether the SIMD fork of Pillow (pillow-simd) is active and which
+    instruction-set level the CPU offers, since AVX2 builds can regress on
+    some machines and users should be able to see what they got."""
+    try:
+        import PIL
+        version = getattr(PIL, "__version__", "unknown")
+        # pillow-simd releases carry a ".postN" suffix on the Pillow version
+        is_simd = "post" in version
+        cpu_flags = ""
+        try:
+            with open("/proc/cpuinfo", "r") as f:
+                info = f.read()
+            cpu_flags = " ".join(lvl for lvl in ("sse4_1", "avx2") if lvl in info)
+        except OSError:
+            import platform
+            cpu_flags = platform.machine()
+        if is_simd:
+            logger.info("pillow-simd %s active (cpu: %s)", version, cpu_flags or "unknown")
+        else:
+            logger.debug("stock Pillow %s in use (cpu: %s); install pillow-simd for SIMD kernels",
+                         version, cpu_flags or "unknown")
+    except Exception:
+        logger.debug("Could not determine Pillow SIMD status")
+
+_log_simd_status()
+
 # --- Optional HEIF/HEIC support via pillow-heif or pyheif ---
 HAS_PILLOW_HEIF = False
 HAS_PYHEIF = False
@@ -33,6 +82,26 @@ try:
 except Exception:
     HAS_PYHEIF = False
 
+# pyvips / libvips (optional): fastest HEIC path. libvips decodes HEIC via
+# libheif, which can use its FFmpeg/NVDEC hardware plugin when present
+# (point HEIF_PLUGIN_DIR at the plugin directory to activate it).
+HAS_PYVIPS = False
+try:
+    import pyvips  # type: ignore
+    HAS_PYVIPS = True
+    logger.debug("pyvips available (preferred for HEIF decode)")
+except Exception:
+    HAS_PYVIPS = False
+
+# NumPy for vectorized alpha compositing (optional)
+HAS_NUMPY = False
+try:
+    import numpy as np  # type: ignore
+    HAS_NUMPY = True
+    logger.debug("numpy available for vectorized compositing")
+except Exception:
+    HAS_NUMPY = False
+
 # RAW support via rawpy + imageio (optional)
 HAS_RAWPY = False
 try:
@@ -44,44 +113,192 @@ except Exception:
     HAS_RAWPY = False
 
 # Supported extensions (lowercase)
+_HEIF_EXTS = frozenset({".heic", ".heif"})
+# Formats Pillow reads in long sequential sweeps; worth a large read buffer
+_BUFFERED_EXTS = frozenset({".tif", ".tiff", ".psd"})
+_RAW_EXTS = frozenset({".raw", ".cr2", ".nef", ".arw", ".dng", ".rw2"})
 SUPPORTED_INPUT_EXTS = {
-    ".png", ".gif", ".tif", ".tiff", ".psd", ".svg", ".webp", ".heic", ".heif",
-    ".raw", ".cr2", ".nef", ".arw", ".dng", ".rw2"
-}
+    ".png", ".gif", ".tif", ".tiff", ".psd", ".svg", ".webp"
+} | _HEIF_EXTS | _RAW_EXTS
 
 # --- Helper functions ---
 
-def _pillow_open(path: Path) -> Image.Image:
-    """Open via Pillow; may raise."""
-    return Image.open(path)
+def _pillow_open(path: Path, target_size: Optional[Tuple[int, int]] = None) -> Image.Image:
+    """Open via Pillow; may raise.
+
+    For JPEGs, request RGB output (and optionally a reduced size) via
+    draft() before the pixel data is loaded: libjpeg decodes straight to
+    RGB at the largest DCT scale <= target_size, skipping the separate
+    YCbCr->RGB pass and, for downscaled targets, most of the IDCT work.
+    """
+    def _open_and_load() -> Image.Image:
+        if path.suffix.lower() in _BUFFERED_EXTS:
+            # 1 MiB reads instead of the 8 KiB default; Pillow owns the file
+            # object and closes it with the image
+            img = Image.open(open(path, "rb", buffering=1 << 20))
+        else:
+            img = Image.open(path)
+        if img.format == "JPEG":
+            try:
+                img.draft("RGB", target_size or img.size)
+            except Exception:
+                logger.debug("draft() not applicable for %s", path)
+        img.load()
+        return img
+
+    try:
+        return _open_and_load()
+    except (OSError, SyntaxError) as e:
+        # Possibly a truncated file; retry once with recovery enabled
+        logger.debug("normal load failed for %s (%s); retrying as truncated", path, e)
+        with _allow_truncated():
+            return _open_and_load()
+
+def _mmap_bytes(path: Path) -> mmap.mmap:
+    """Memory-map path read-only. The decoder then reads straight from the
+    kernel page cache via page faults instead of a full-file copy into the
+    Python heap."""
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
 
 def _open_heif_pyheif(path: Path) -> Image.Image:
     """Open HEIF/HEIC via pyheif and wrap into Pillow Image."""
     # pyheif returns raw bytes and metadata; convert to PIL.Image
     import pyheif  # local import; already attempted above
-    heif_file = pyheif.read(path.read_bytes())
+    try:
+        buf = _mmap_bytes(path)
+    except (OSError, ValueError):
+        # empty file or mmap-unfriendly filesystem
+        buf = path.read_bytes()
+    try:
+        # pyheif accepts any buffer-protocol object; fall back to a bytes
+        # copy only for builds that insist on bytes
+        try:
+            heif_file = pyheif.read(buf)
+        except TypeError:
+            heif_file = pyheif.read(bytes(buf))
+    finally:
+        if isinstance(buf, mmap.mmap):
+            buf.close()
     mode = heif_file.mode
     size = heif_file.size
     data = heif_file.data
-    # Some pyheif builds expose stride; use Image.frombytes
-    try:
-        img = Image.frombytes(mode, size, data, "raw", mode, heif_file.stride)
-    except Exception:
-        # fallback: use RGBA conversion
-        img = Image.frombytes(mode, size, data)
-    return img
+    # frombuffer only aliases for mmap-able modes (RGBA is, RGB is not, in
+    # which case it degrades to a frombytes copy); pin the backing bytes
+    # only when the alias is real
+    if mode == "RGBA":
+        try:
+            img = Image.frombuffer(mode, size, data, "raw", mode, heif_file.stride, 1)
+            img._heif_buf = data  # keep the backing bytes alive
+            return img
+        except Exception:
+            pass
+    return Image.frombytes(mode, size, data)
 
-def _open_raw(path: Path) -> Image.Image:
-    """Open RAW files using rawpy + imageio, return PIL Image."""
+def _open_heif_vips(path: Path) -> Image.Image:
+    """Open HEIF/HEIC via libvips and wrap the pixel memory into Pillow.
+
+    libvips decodes through libheif directly (optionally with its hardware
+    HEVC plugin), which is considerably faster than pyheif's software
+    libde265 path on iPhone-style tiled HEICs.
+    """
+    import pyvips  # local import; already attempted above
+    vi = pyvips.Image.new_from_file(str(path), access="sequential")
+    mode = "RGBA" if vi.bands == 4 else "RGB"
+    if vi.bands not in (3, 4):
+        vi = vi.colourspace("srgb")
+        mode = "RGB"
+    mem = vi.write_to_memory()
+    if mode == "RGBA":
+        # real zero-copy alias; RGB is not an mmap-able mode so frombuffer
+        # would copy anyway
+        img = Image.frombuffer(mode, (vi.width, vi.height), mem, "raw", mode, 0, 1)
+        img._vips_buf = mem  # keep the backing memory alive
+        return img
+    return Image.frombytes(mode, (vi.width, vi.height), mem)
+
+def _open_raw(path: Path, raw_speed: str = "fast") -> Image.Image:
+    """Open RAW files using rawpy + imageio, return PIL Image.
+
+    raw_speed "fast" uses LINEAR demosaic at half size with 8-bit output:
+    half_size skips one demosaic level (4x fewer pixels), LINEAR is ~3x
+    faster than AHD, and output_bps=8 avoids a later 16->8 conversion.
+    "quality" keeps the slower AHD demosaic at full resolution.
+    """
     import rawpy  # local import
+    params = dict(use_camera_wb=True, no_auto_bright=True, output_bps=8)
+    if raw_speed == "fast":
+        params.update(demosaic_algorithm=rawpy.DemosaicAlgorithm.LINEAR, half_size=True)
+    else:
+        params.update(demosaic_algorithm=rawpy.DemosaicAlgorithm.AHD)
     with rawpy.imread(str(path)) as raw:
-        rgb = raw.postprocess()
+        rgb = raw.postprocess(**params)
+    # fromarray copies, but so would frombuffer: "RGB" is not an mmap-able
+    # Pillow mode, so frombuffer falls back to frombytes anyway. The plain
+    # copy also lets the postprocess ndarray be freed immediately.
     return Image.fromarray(rgb)
 
-def open_image(path: Path) -> Image.Image:
+def _heif_handler(path: Path, target_size: Optional[Tuple[int, int]] = None) -> Image.Image:
+    """HEIF/HEIC dispatch target: pyvips, then pillow-heif, then pyheif,
+    then plain Pillow."""
+    if HAS_PYVIPS:
+        try:
+            return _open_heif_vips(path)
+        except Exception as e:
+            logger.debug("pyvips open failed: %s", e)
+    # Prefer pillow-heif if available (registered into Pillow)
+    if HAS_PILLOW_HEIF:
+        return _pillow_open(path, target_size)
+    if HAS_PYHEIF:
+        try:
+            return _open_heif_pyheif(path)
+        except Exception as e:
+            logger.debug("pyheif open failed: %s", e)
+    # fallback to Pillow (may fail)
+    return _pillow_open(path, target_size)
+
+def _raw_handler(path: Path, target_size: Optional[Tuple[int, int]] = None,
+                 raw_speed: str = "fast") -> Image.Image:
+    """RAW dispatch target: rawpy, then plain Pillow."""
+    if HAS_RAWPY:
+        try:
+            return _open_raw(path, raw_speed=raw_speed)
+        except Exception as e:
+            logger.debug("rawpy open failed: %s", e)
+    # fallback to Pillow (may fail)
+    return _pillow_open(path, target_size)
+
+# Extension -> handler dispatch; one dict lookup replaces the per-call set
+# literals and membership branches on the hot path.
+_DISPATCH = {ext: _heif_handler for ext in _HEIF_EXTS}
+_DISPATCH.update({ext: _raw_handler for ext in _RAW_EXTS})
+
+# --- Decoded-image LRU cache ---
+# UI workflows re-open the same file repeatedly (preview, convert, re-convert
+# at another quality); caching the decoded Image skips the whole decode on a
+# hit. Bounded, and disabled for oversized files. IMG2JPG_CACHE=0 turns it off.
+try:
+    _CACHE_MAX_ENTRIES = int(os.environ.get("IMG2JPG_CACHE", "8"))
+except ValueError:
+    _CACHE_MAX_ENTRIES = 8
+# Admission bound on the *decoded* frame (w * h * bytes-per-pixel): compressed
+# file size says nothing about memory cost (a small PNG can decode to >1 GB)
+_CACHE_MAX_DECODED_BYTES = 64 * 1024 * 1024
+_open_cache: "collections.OrderedDict" = collections.OrderedDict()
+# keys seen exactly once: an entry is only admitted on its second open, so the
+# one-shot batch path never pays the populate copy for a cache it won't hit
+_open_cache_seen: "collections.OrderedDict" = collections.OrderedDict()
+_open_cache_lock = threading.Lock()
+
+def open_image(path: Path, target_size: Optional[Tuple[int, int]] = None,
+               raw_speed: str = "fast") -> Image.Image:
     """
     Open an image with the best available handler.
     - Path: pathlib.Path
+    - target_size: optional (w, h) hint; JPEG decode may return a larger
+      intermediate size (the nearest DCT scale), callers resize afterwards
+    - raw_speed: "fast" (LINEAR demosaic, half size) or "quality" (AHD,
+      full size); only affects RAW sources
     - Returns: PIL.Image
     Raises exception on failure.
     """
@@ -89,33 +306,61 @@ def open_image(path: Path) -> Image.Image:
     if not path.exists():
         raise FileNotFoundError(str(path))
 
-    ext = path.suffix.lower()
-
-    # HEIF/HEIC handling
-    if ext in {".heic", ".heif"}:
-        # Prefer pillow-heif if available (registered into Pillow)
-        if HAS_PILLOW_HEIF:
-            return _pillow_open(path)
-        if HAS_PYHEIF:
+    # Cache full decodes keyed on identity + content fingerprint; callers own
+    # (and may close) the returned copy, the cached original stays open.
+    # target_size decodes are size-dependent, so they bypass the cache.
+    st = path.stat()
+    cache_key = None
+    if _CACHE_MAX_ENTRIES > 0 and target_size is None:
+        cache_key = (str(path.resolve()), st.st_mtime_ns, st.st_size, raw_speed)
+        with _open_cache_lock:
+            cached = _open_cache.get(cache_key)
+            if cached is not None:
+                _open_cache.move_to_end(cache_key)
+        if cached is not None:
+            # copy outside the lock: a full-frame memcpy must not serialize
+            # all workers. Eviction may close the original underneath us, in
+            # which case fall through and decode normally.
             try:
-                return _open_heif_pyheif(path)
-            except Exception as e:
-                logger.debug("pyheif open failed: %s", e)
-        # fallback to Pillow (may fail)
-        return _pillow_open(path)
+                return cached.copy()
+            except Exception:
+                pass
 
-    # RAW handling
-    if ext in {".raw", ".cr2", ".nef", ".arw", ".dng", ".rw2"}:
-        if HAS_RAWPY:
-            try:
-                return _open_raw(path)
-            except Exception as e:
-                logger.debug("rawpy open failed: %s", e)
-        # fallback to Pillow (may fail)
-        return _pillow_open(path)
+    # Other formats (the dominant PNG/JPEG case included) defer to Pillow
+    # (SVG may require cairosvg or pillow-simd etc)
+    handler = _DISPATCH.get(path.suffix.lower(), _pillow_open)
+    if handler is _raw_handler:
+        img = handler(path, target_size, raw_speed)
+    else:
+        img = handler(path, target_size)
 
-    # Other formats: defer to Pillow (SVG may require cairosvg or pillow-simd etc)
-    return _pillow_open(path)
+    if cache_key is not None:
+        try:
+            img.load()
+            decoded_bytes = img.width * img.height * len(img.mode)
+            if decoded_bytes <= _CACHE_MAX_DECODED_BYTES:
+                with _open_cache_lock:
+                    if cache_key in _open_cache_seen:
+                        # second open of this key: worth caching now
+                        _open_cache_seen.pop(cache_key, None)
+                        _open_cache[cache_key] = img
+                        while len(_open_cache) > _CACHE_MAX_ENTRIES:
+                            _, evicted = _open_cache.popitem(last=False)
+                            try:
+                                evicted.close()
+                            except Exception:
+                                pass
+                        admitted = True
+                    else:
+                        _open_cache_seen[cache_key] = True
+                        while len(_open_cache_seen) > _CACHE_MAX_ENTRIES * 4:
+                            _open_cache_seen.popitem(last=False)
+                        admitted = False
+                if admitted:
+                    return img.copy()
+        except Exception:
+            logger.debug("decoded-image cache insert failed for %s", path)
+    return img
 
 def _preserve_exif_bytes(src_img: Image.Image) -> Optional[bytes]:
     """Try to extract raw EXIF bytes from a Pillow Image (if any)."""
@@ -127,24 +372,43 @@ def _preserve_exif_bytes(src_img: Image.Image) -> Optional[bytes]:
         logger.debug("Failed to read EXIF bytes")
     return None
 
+def _composite_numpy(img: Image.Image, background: Tuple[int, int, int]) -> Image.Image:
+    """Composite an image with alpha onto a solid background in one fused pass.
+
+    Equivalent to the Image.new + split + paste sequence but touches the
+    pixel buffer once instead of 3-4 times; the arithmetic runs inside
+    NumPy's SIMD kernels.
+    """
+    arr = np.asarray(img.convert("RGBA"), dtype=np.uint8)
+    rgb = arr[..., :3].astype(np.uint16)
+    a = arr[..., 3:4].astype(np.uint16)
+    bg = np.array(background, dtype=np.uint16)
+    out = ((rgb * a + bg * (255 - a) + 127) // 255).astype(np.uint8)
+    return Image.fromarray(out, "RGB")
+
 def _ensure_rgb_for_jpeg(img: Image.Image, background: Tuple[int, int, int]) -> Image.Image:
     """
     Convert image to RGB suitable for JPEG.
     If the image has an alpha channel, composite it onto a single-color background.
     Returns a new Image object (caller should close original if necessary).
+    Images already in RGB are returned as-is (no copy).
     """
+    # Fast path: JPEG-like sources are already RGB, skip the full-buffer copy
+    # that convert("RGB") would make. Callers handle the aliasing (see the
+    # `out_img is not img` check in convert_to_jpg's cleanup).
+    if img.mode == "RGB":
+        return img
     try:
         if img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info):
-            bg = Image.new("RGB", img.size, background)
-            if img.mode in ("RGBA", "LA"):
-                alpha = img.split()[-1]
-                bg.paste(img.convert("RGBA"), mask=alpha)
-            else:
-                # Palette with transparency
-                rgba = img.convert("RGBA")
-                alpha = rgba.split()[-1]
-                bg.paste(rgba, mask=alpha)
-            return bg
+            if HAS_NUMPY:
+                return _composite_numpy(img, background)
+            # alpha_composite is one SIMD-vectorized C blend loop (SSE4 in
+            # pillow-simd); paste-with-mask goes through the slower general
+            # mask-gather path and needs the alpha extracted separately
+            bg_rgba = Image.new("RGBA", img.size, tuple(background) + (255,))
+            src_rgba = img if img.mode == "RGBA" else img.convert("RGBA")
+            composited = Image.alpha_composite(bg_rgba, src_rgba)
+            return composited.convert("RGB")
         else:
             return img.convert("RGB")
     except Exception:
@@ -154,6 +418,117 @@ def _ensure_rgb_for_jpeg(img: Image.Image, background: Tuple[int, int, int]) ->
         except Exception:
             raise
 
+def _save_jpeg(out_img: Image.Image, dst_path: Path, save_kwargs: dict) -> None:
+    """Encode to an in-memory buffer and write the file in a single syscall.
+
+    Saving straight to a path lets Pillow/libjpeg flush in small chunks;
+    encoding into BytesIO first coalesces those into one write(). During
+    batch runs the written pages are also dropped from the page cache
+    (posix_fadvise) since the output will not be read back.
+    """
+    buf = io.BytesIO()
+    out_img.save(buf, **save_kwargs)
+    data = buf.getbuffer()
+    fd = os.open(dst_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # os.write may write fewer bytes than asked (EINTR, platform limits);
+        # loop so a short write can't silently truncate the output
+        written = 0
+        total = len(data)
+        while written < total:
+            written += os.write(fd, data[written:])
+        if hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(fd, 0, len(data), os.POSIX_FADV_DONTNEED)
+            except OSError:
+                pass
+    finally:
+        os.close(fd)
+
+def _convert_to_jpg_vips(src: Path, dst_path: Path, save_kwargs: dict,
+                         background: Tuple[int, int, int], keep_exif: bool) -> str:
+    """Fused decode -> flatten -> encode through a streaming libvips pipeline.
+
+    libvips pulls strips of ~128 scanlines through the whole chain without
+    materializing the full decoded image or any composite intermediate, so
+    memory traffic drops from several times the image size to roughly one
+    strip per pipeline stage.
+    """
+    import pyvips  # local import; availability checked by caller
+    vi = pyvips.Image.new_from_file(str(src), access="sequential")
+    if vi.hasalpha():
+        vi = vi.flatten(background=list(background))
+    vi.jpegsave(
+        str(dst_path),
+        Q=save_kwargs.get("quality", 85),
+        optimize_coding=bool(save_kwargs.get("optimize", False)),
+        interlace=bool(save_kwargs.get("progressive", False)),
+        strip=not keep_exif,
+    )
+    return str(dst_path)
+
+# Guards the check-then-add on the shared existing_names set: two threads
+# converting sources with the same stem (e.g. a RAW+JPEG pair) must not both
+# claim the same output name.
+_existing_names_lock = threading.Lock()
+
+def _resolve_dst_path(base_name: str, dst_dir: Path, overwrite: bool,
+                      existing_names: Optional[set]) -> Path:
+    """Pick a collision-free '<base_name>.jpg' destination in dst_dir.
+
+    With an existing_names snapshot (batch mode) the suffix search runs
+    purely in memory and the chosen name is recorded in the set; without
+    one, candidates are stat()ed as before.
+    """
+    if existing_names is not None:
+        # Resolve collisions against the in-memory snapshot: O(1) amortized
+        # instead of one stat() per candidate. Membership check and add are
+        # one atomic step so concurrent workers get distinct names.
+        with _existing_names_lock:
+            name = f"{base_name}.jpg"
+            if name in existing_names and not overwrite:
+                i = 1
+                while f"{base_name}_{i}.jpg" in existing_names:
+                    i += 1
+                name = f"{base_name}_{i}.jpg"
+            existing_names.add(name)
+        return dst_dir.joinpath(name)
+    dst_path = dst_dir.joinpath(f"{base_name}.jpg")
+    if dst_path.exists() and not overwrite:
+        i = 1
+        while True:
+            candidate = dst_dir.joinpath(f"{base_name}_{i}.jpg")
+            if not candidate.exists():
+                dst_path = candidate
+                break
+            i += 1
+    return dst_path
+
+def _build_save_kwargs(
+    quality: int,
+    optimize: bool = False,
+    progressive: bool = False,
+    jpeg_subsample: Optional[str] = None,
+    keep_exif: bool = False
+) -> dict:
+    """Build the Pillow save kwargs (quality clamp included) once.
+
+    batch_convert shares a single dict across all files instead of
+    rebuilding and re-clamping per conversion.
+    """
+    save_kwargs = {
+        "format": "JPEG",
+        "quality": int(max(1, min(95, quality))),
+        "optimize": optimize,
+        "progressive": progressive,
+    }
+    if jpeg_subsample is not None:
+        save_kwargs["subsampling"] = jpeg_subsample  # Pillow accepts 'subsampling' in some versions
+    if not keep_exif:
+        # strip the often-large color profile chunk along with EXIF
+        save_kwargs["icc_profile"] = b""
+    return save_kwargs
+
 # --- Public API: convert single image to JPEG ---
 
 def convert_to_jpg(
@@ -163,7 +538,15 @@ def convert_to_jpg(
     background: Tuple[int, int, int] = (255, 255, 255),
     keep_exif: bool = False,
     overwrite: bool = False,
-    jpeg_subsample: Optional[str] = None
+    jpeg_subsample: Optional[str] = None,
+    target_size: Optional[Tuple[int, int]] = None,
+    optimize: bool = False,
+    progressive: bool = False,
+    existing_names: Optional[set] = None,
+    raw_speed: str = "fast",
+    exif_override: Optional[bytes] = None,
+    passthrough_jpeg: bool = False,
+    max_side: Optional[int] = None
 ) -> str:
     """
     Convert a single image to JPEG.
@@ -176,6 +559,27 @@ def convert_to_jpg(
       keep_exif: attempt to preserve EXIF bytes where possible
       overwrite: if True, overwrite existing file; otherwise add numeric suffix to avoid collision
       jpeg_subsample: pass to Pillow 'subsampling' option if desired ('4:4:4', '4:2:0', etc) - None uses default
+      target_size: optional (w, h) decode hint for thumbnailing callers; lets
+        JPEG sources decode at a reduced DCT scale instead of full resolution
+      optimize: run the extra Huffman-table optimization pass. Roughly doubles
+        encode CPU for a small size win; worth it for one-off asset pipelines,
+        not for bulk conversion, hence off by default
+      progressive: write a progressive JPEG (also extra encode work)
+      existing_names: optional mutable set of file names already present in
+        dst_dir (as snapshotted by batch_convert); collision suffixes are then
+        resolved against the set in memory instead of stat()ing candidates.
+        The chosen name is added to the set before returning
+      raw_speed: "fast" or "quality" demosaic for RAW sources (see open_image)
+      exif_override: pre-extracted EXIF bytes to embed when keep_exif is set
+        (e.g. from exif_batch.ExifBatch), skipping the Pillow metadata parse
+      passthrough_jpeg: copy .jpg/.jpeg sources byte-for-byte (in-kernel via
+        sendfile where available) instead of decoding and re-encoding them.
+        Only taken together with keep_exif, since the copy preserves all
+        metadata; note the requested quality is then ignored, which is why
+        this is opt-in
+      max_side: optional bound on the longer output edge. Power-of-2 shrink
+        factors use Image.reduce (SIMD box filter, much cheaper than LANCZOS);
+        other factors fall back to thumbnail with LANCZOS
 
     Returns:
       The saved JPEG file path (str)
@@ -183,15 +587,87 @@ def convert_to_jpg(
     Raises:
       RuntimeError on failure.
     """
+    return _convert_to_jpg_with_kwargs(
+        src_path=src_path,
+        dst_dir=dst_dir,
+        save_kwargs=_build_save_kwargs(quality, optimize, progressive, jpeg_subsample, keep_exif),
+        background=background,
+        keep_exif=keep_exif,
+        overwrite=overwrite,
+        target_size=target_size,
+        existing_names=existing_names,
+        raw_speed=raw_speed,
+        exif_override=exif_override,
+        passthrough_jpeg=passthrough_jpeg,
+        max_side=max_side
+    )
+
+def _convert_to_jpg_with_kwargs(
+    src_path: str,
+    dst_dir: str,
+    save_kwargs: dict,
+    background: Tuple[int, int, int] = (255, 255, 255),
+    keep_exif: bool = False,
+    overwrite: bool = False,
+    target_size: Optional[Tuple[int, int]] = None,
+    existing_names: Optional[set] = None,
+    raw_speed: str = "fast",
+    exif_override: Optional[bytes] = None,
+    passthrough_jpeg: bool = False,
+    max_side: Optional[int] = None
+) -> str:
+    """Conversion core taking prebuilt save kwargs (see _build_save_kwargs).
+
+    batch_convert calls this directly with one shared kwargs dict, skipping
+    the per-file dict build and quality clamp; the public convert_to_jpg
+    wrapper builds the kwargs and delegates here. save_kwargs is treated as
+    read-only.
+    """
     src = Path(src_path)
     dst_dir = Path(dst_dir)
     if not src.exists():
         raise FileNotFoundError(f"Source not found: {src}")
     dst_dir.mkdir(parents=True, exist_ok=True)
 
+    # Destination is independent of the pixel data; resolve it once up front
+    # so the passthrough, pyvips, and Pillow paths all share it
+    dst_path = _resolve_dst_path(src.stem, dst_dir, overwrite, existing_names)
+    ext = src.suffix.lower()
+
+    # Already-JPEG sources can skip the whole decode+encode pipeline: copy
+    # byte-for-byte (shutil.copyfile uses in-kernel sendfile on Linux).
+    # Requires keep_exif since the copy carries all source metadata along.
+    if passthrough_jpeg and keep_exif and ext in {".jpg", ".jpeg"}:
+        try:
+            shutil.copyfile(src, dst_path)
+        except Exception as e:
+            logger.exception("Failed to copy JPEG %s: %s", src, e)
+            raise RuntimeError(f"Failed to copy {src} to {dst_path}: {e}") from e
+        saved = str(dst_path)
+        logger.info("Copied JPEG without re-encode: %s", saved)
+        return saved
+
+    # Fused fast path: let libvips stream decode -> flatten -> encode in one
+    # pipeline. HEIC/RAW keep their dedicated handlers, and resize hints or
+    # explicit subsampling stay on the Pillow path which implements them.
+    if (HAS_PYVIPS and ext not in _HEIF_EXTS and ext not in _RAW_EXTS
+            and target_size is None and max_side is None
+            and "subsampling" not in save_kwargs and exif_override is None):
+        try:
+            saved = _convert_to_jpg_vips(src, dst_path, save_kwargs, background, keep_exif)
+            logger.info("Saved JPEG (vips): %s", saved)
+            return saved
+        except Exception as e:
+            logger.debug("pyvips convert failed for %s (%s); falling back to Pillow", src, e)
+
+    # A max_side bound doubles as the decode hint: JPEG sources then decode
+    # at the nearest DCT scale and the shrink below finishes the job
+    if max_side and target_size is None:
+        target_size = (max_side, max_side)
+
     # Open image with fallback handlers
     try:
-        img = open_image(src)
+        img = open_image(src, target_size=target_size, raw_speed=raw_speed)
     except Exception as e:
         logger.exception("Failed to open image %s: %s", src, e)
         raise RuntimeError(f"Failed to open {src}: {e}") from e
@@ -208,31 +684,29 @@ def convert_to_jpg(
             pass
         raise RuntimeError(f"Error converting image mode: {e}") from e
 
-    # Determine destination filename
-    base_name = src.stem
-    dst_path = dst_dir.joinpath(f"{base_name}.jpg")
-    if dst_path.exists() and not overwrite:
-        i = 1
-        while True:
-            candidate = dst_dir.joinpath(f"{base_name}_{i}.jpg")
-            if not candidate.exists():
-                dst_path = candidate
-                break
-            i += 1
-
-    # Build save kwargs
-    save_kwargs = {"format": "JPEG", "quality": int(max(1, min(95, quality))), "optimize": True}
-    if jpeg_subsample is not None:
-        save_kwargs["subsampling"] = jpeg_subsample  # Pillow accepts 'subsampling' in some versions
+    # Optional downscale: integer power-of-2 factors use the box-filter
+    # reduce() (pure add+shift, SIMD in pillow-simd), anything else falls
+    # back to LANCZOS via thumbnail()
+    if max_side and max(out_img.size) > max_side:
+        factor = max(1, max(out_img.size) // max_side)
+        if factor > 1 and (factor & (factor - 1)) == 0 and max(out_img.size) % factor == 0 \
+                and max(out_img.size) // factor <= max_side:
+            reduced = out_img.reduce(factor)
+            if out_img is not img:
+                out_img.close()
+            out_img = reduced
+        else:
+            out_img.thumbnail((max_side, max_side), Image.LANCZOS)
 
-    # Preserve EXIF if requested and available
+    # Preserve EXIF if requested and available; the shared kwargs dict stays
+    # untouched, per-file EXIF goes into a local copy
     if keep_exif:
-        exif_bytes = _preserve_exif_bytes(img)
+        exif_bytes = exif_override if exif_override is not None else _preserve_exif_bytes(img)
         if exif_bytes:
-            save_kwargs["exif"] = exif_bytes
+            save_kwargs = dict(save_kwargs, exif=exif_bytes)
 
     try:
-        out_img.save(dst_path, **save_kwargs)
+        _save_jpeg(out_img, dst_path, save_kwargs)
         saved = str(dst_path)
         logger.info("Saved JPEG: %s", saved)
     except Exception as e:
@@ -254,6 +728,24 @@ def convert_to_jpg(
 
 # --- Batch conversion helper with progress callback ---
 
+def _convert_one(args: Tuple) -> str:
+    """Picklable worker helper: unpack one task tuple and convert it.
+
+    Must stay a module-level function so ProcessPoolExecutor can pickle it.
+    """
+    (src, dst_dir, save_kwargs, background, keep_exif, overwrite,
+     existing_names, exif_override) = args
+    return _convert_to_jpg_with_kwargs(
+        src_path=src,
+        dst_dir=dst_dir,
+        save_kwargs=save_kwargs,
+        background=background,
+        keep_exif=keep_exif,
+        overwrite=overwrite,
+        existing_names=existing_names,
+        exif_override=exif_override
+    )
+
 def batch_convert(
     src_paths: Iterable[str],
     dst_dir: str,
@@ -261,37 +753,107 @@ def batch_convert(
     background: Tuple[int, int, int] = (255, 255, 255),
     keep_exif: bool = False,
     overwrite: bool = False,
-    progress_callback: Optional[Callable[[int, int, str, str, Optional[str]], None]] = None
+    progress_callback: Optional[Callable[[int, int, str, str, Optional[str]], None]] = None,
+    max_workers: Optional[int] = None,
+    optimize: bool = False,
+    progressive: bool = False,
+    use_processes: bool = False
 ) -> List[Tuple[str, str, Optional[str]]]:
     """
-    Convert multiple images sequentially (caller can run in threadpool).
-    progress_callback signature: (index:int, total:int, src:str, dst:str, error:Optional[str])
+    Convert multiple images in parallel (one worker per core).
+
+    Pillow releases the GIL inside the libjpeg decode/encode calls, so a
+    ThreadPoolExecutor overlaps the C codec work on all cores with no
+    fork or pickling overhead and a shared warm codec state; it is the
+    default. use_processes=True switches to a ProcessPoolExecutor for
+    workloads with heavy Python-level time per file (ignored when
+    keep_exif needs in-process image state).
+
+    progress_callback signature: (done:int, total:int, src:str, dst:str, error:Optional[str])
+    Invoked from the calling thread as each conversion completes.
 
-    Returns list of tuples (src, dst_or_empty, error_or_None)
+    Returns list of tuples (src, dst_or_empty, error_or_None) in input order.
     """
     src_list = list(src_paths)
     total = len(src_list)
-    results: List[Tuple[str, str, Optional[str]]] = []
-    for idx, src in enumerate(src_list, start=1):
-        dst = ""
-        err = None
-        try:
-            saved = convert_to_jpg(
-                src_path=src,
-                dst_dir=dst_dir,
-                quality=quality,
-                background=background,
-                keep_exif=keep_exif,
-                overwrite=overwrite
-            )
-            dst = saved
-        except Exception as e:
-            logger.exception("batch_convert error for %s: %s", src, e)
-            err = str(e)
-        results.append((src, dst, err))
+    results: List[Optional[Tuple[str, str, Optional[str]]]] = [None] * total
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(total, max_workers))
+
+    # One shared save-kwargs dict for the whole batch; per-file EXIF is
+    # layered on inside the conversion core without mutating it
+    base_kwargs = _build_save_kwargs(quality, optimize, progressive, keep_exif=keep_exif)
+
+    # Snapshot the destination directory once so collision suffixes are
+    # resolved in memory rather than via a stat() per candidate per file
+    existing_names: Optional[set] = None
+    try:
+        Path(dst_dir).mkdir(parents=True, exist_ok=True)
+        existing_names = {e.name for e in os.scandir(dst_dir)}
+    except OSError:
+        existing_names = None
+
+    # With keep_exif, pre-extract all EXIF blobs in one streaming pass
+    # through a persistent exiftool process instead of re-parsing each
+    # file's metadata via Pillow (slow for HEIC/RAW)
+    exif_map = {}
+    if keep_exif and total > 1:
+        from app.core import exif_batch
+        if exif_batch.exiftool_available():
+            try:
+                with exif_batch.ExifBatch() as et:
+                    exif_map = et.extract_all(src_list)
+                logger.debug("exiftool pre-extracted EXIF for %d/%d files", len(exif_map), total)
+            except Exception:
+                logger.debug("exiftool batch extraction failed; falling back to Pillow", exc_info=True)
+                exif_map = {}
+
+    def _record(done: int, idx: int, src: str, dst: str, err: Optional[str]):
+        results[idx - 1] = (src, dst, err)
         if callable(progress_callback):
             try:
-                progress_callback(idx, total, src, dst, err)
+                progress_callback(done, total, src, dst, err)
             except Exception:
                 logger.exception("progress_callback raised an exception")
+
+    # Serial path: a pool is pure overhead for a single file / single worker
+    if total <= 1 or max_workers == 1:
+        for idx, src in enumerate(src_list, start=1):
+            dst = ""
+            err = None
+            try:
+                dst = _convert_one((src, dst_dir, base_kwargs, background, keep_exif, overwrite,
+                                    existing_names, exif_map.get(str(src))))
+            except Exception as e:
+                logger.exception("batch_convert error for %s: %s", src, e)
+                err = str(e)
+            _record(idx, idx, src, dst, err)
+        return results
+
+    executor_cls = (concurrent.futures.ProcessPoolExecutor
+                    if use_processes and not keep_exif
+                    else concurrent.futures.ThreadPoolExecutor)
+    # The shared name snapshot only works where mutations are visible to all
+    # workers; process-pool workers get a pickled copy, so they keep the
+    # stat-based collision path instead
+    shared_names = existing_names if executor_cls is concurrent.futures.ThreadPoolExecutor else None
+    with executor_cls(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_convert_one, (src, dst_dir, base_kwargs, background, keep_exif, overwrite,
+                                           shared_names, exif_map.get(str(src)))): (idx, src)
+            for idx, src in enumerate(src_list, start=1)
+        }
+        done = 0
+        for fut in concurrent.futures.as_completed(futures):
+            idx, src = futures[fut]
+            dst = ""
+            err = None
+            try:
+                dst = fut.result()
+            except Exception as e:
+                logger.exception("batch_convert error for %s: %s", src, e)
+                err = str(e)
+            done += 1
+            _record(done, idx, src, dst, err)
     return results
@@ -0,0 +1,126 @@
+# app/core/exif_batch.py
+# Batch EXIF extraction via a single persistent exiftool subprocess.
+# One `exiftool -stay_open True` process serves a whole batch_convert call,
+# amortizing the ~150 ms exiftool startup across all files and avoiding the
+# slow Pillow metadata parse for HEIC/RAW sources.
+
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+import logging
+import shutil
+import subprocess
+
+logger = logging.getLogger("ImageToJpgApp.exif_batch")
+
+_READY_MARKER = b"{ready}"
+_EXIF_HEADER = b"Exif\x00\x00"
+
+
+def exiftool_available() -> bool:
+    """True if the exiftool binary is on PATH."""
+    return shutil.which("exiftool") is not None
+
+
+class ExifBatch:
+    """Wrap one `exiftool -stay_open True -@ -` subprocess.
+
+    Filenames are piped on stdin and the raw EXIF blob is read back per
+    -execute, so a whole batch is served by a single streaming process.
+    Use as a context manager so the subprocess is always torn down.
+    """
+
+    def __init__(self):
+        self._proc = subprocess.Popen(
+            ["exiftool", "-stay_open", "True", "-@", "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        # stdout carry-over between commands (read1 boundaries don't align
+        # with the {ready} marker) and whether the marker's own newline is
+        # still owed from the previous command
+        self._outbuf = bytearray()
+        self._pending_nl = False
+
+    def __enter__(self) -> "ExifBatch":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def extract(self, path) -> Optional[bytes]:
+        """Return the raw EXIF bytes for path (Exif header included), or None."""
+        if self._proc.poll() is not None:
+            return None
+        try:
+            self._proc.stdin.write(
+                b"-fast\n-b\n-EXIF\n" + str(path).encode("utf-8", "surrogateescape") + b"\n-execute\n"
+            )
+            self._proc.stdin.flush()
+            data = self._read_until_ready()
+        except Exception:
+            logger.debug("exiftool extract failed for %s", path, exc_info=True)
+            return None
+        if not data:
+            return None
+        # Pillow's JPEG writer expects the APP1 payload incl. the Exif header
+        if not data.startswith(_EXIF_HEADER):
+            data = _EXIF_HEADER + data
+        return data
+
+    def extract_all(self, paths: Iterable) -> Dict[str, bytes]:
+        """Extract EXIF for every path; files without EXIF are omitted."""
+        out: Dict[str, bytes] = {}
+        for p in paths:
+            exif = self.extract(p)
+            if exif:
+                out[str(p)] = exif
+        return out
+
+    def close(self):
+        """Ask exiftool to exit and reap the subprocess."""
+        if self._proc.poll() is None:
+            try:
+                self._proc.stdin.write(b"-stay_open\nFalse\n")
+                self._proc.stdin.flush()
+                self._proc.wait(timeout=5)
+            except Exception:
+                self._proc.kill()
+
+    def _read_until_ready(self) -> bytes:
+        """Read stdout up to exiftool's per-command {ready} marker.
+
+        -b block output is byte-exact with no separator before the marker
+        ({ready}\\n is appended directly after the data), so the payload is
+        returned untouched; only the marker and its own newline are consumed.
+        """
+        buf = self._outbuf
+        while True:
+            if self._pending_nl and buf:
+                # newline belonging to the previous command's marker line
+                if buf.startswith(b"\r\n"):
+                    del buf[:2]
+                elif buf.startswith(b"\n"):
+                    del buf[:1]
+                self._pending_nl = False
+            idx = buf.find(_READY_MARKER)
+            if idx != -1:
+                payload = bytes(buf[:idx])
+                end = idx + len(_READY_MARKER)
+                if buf[end:end + 2] == b"\r\n":
+                    end += 2
+                elif buf[end:end + 1] == b"\n":
+                    end += 1
+                else:
+                    # marker's newline not read yet; drop it on the next call
+                    self._pending_nl = True
+                del buf[:end]
+                # no trailing-newline strip: -b output has no separator before
+                # the marker, and EXIF blobs can legitimately end in 0x0A/0x0D
+                return payload
+            chunk = self._proc.stdout.read1(65536)
+            if not chunk:
+                payload = bytes(buf)
+                buf.clear()
+                return payload
+            buf.extend(chunk)
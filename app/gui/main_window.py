@@ -7,18 +7,27 @@
 
 from pathlib import Path
 from typing import List, Optional, Tuple, Dict
+import collections
 import concurrent.futures
+import hashlib
+import mmap
+import random
 import threading
-import time
-import traceback
-import queue
 import os
 import re
 
 from PyQt5 import QtWidgets, QtCore, QtGui
 
+# xxHash is much faster than SHA1 for thumbnail-cache keys (optional)
+HAS_XXHASH = False
+try:
+    import xxhash  # type: ignore
+    HAS_XXHASH = True
+except Exception:
+    HAS_XXHASH = False
+
 from app.core import converter
-from app.utils.logging import setup_logger
+from app.utils.logging import setup_logger, QtLogHandler
 
 # ---------- Signals container for worker threads ----------
 class WorkerSignals(QtCore.QObject):
@@ -26,6 +35,21 @@ class WorkerSignals(QtCore.QObject):
     finished = QtCore.pyqtSignal(list)  # list of (src, dst, error)
     log = QtCore.pyqtSignal(str)  # textual log lines
 
+# ---------- Shared conversion pool ----------
+# 変換用スレッドプールはアプリの寿命いっぱい生かして再利用する。実行ごとの
+# プール生成・破棄はスレッド起動コストに加えて libjpeg/Pillow 側のウォームアップ
+# も捨ててしまう。並列度はプールサイズではなく PoolWorker 側のセマフォ
+# （スピンボックスの値）で絞る。
+_CONV_POOL: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+def _conv_pool() -> concurrent.futures.ThreadPoolExecutor:
+    global _CONV_POOL
+    if _CONV_POOL is None:
+        _CONV_POOL = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(16, (os.cpu_count() or 4) * 2),
+            thread_name_prefix="conv")
+    return _CONV_POOL
+
 # ---------- PoolWorker: manages ThreadPoolExecutor and per-task retry ----------
 class PoolWorker(QtCore.QObject):
     def __init__(self, src_items: List[Dict], dst_dir: str, common_options: dict, max_workers: int = 4):
@@ -36,43 +60,93 @@ class PoolWorker(QtCore.QObject):
         self.dst_dir = dst_dir
         self.options = common_options
         self.max_workers = max_workers
-        self._futures = []
         self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._progress_stride = 1
 
     def start(self):
         """Starts submission loop. Intended to be invoked from a QThread (via QThread.started)."""
         total = len(self.src_items)
         self.signals.log.emit(f"ワーカープールを開始 (max_workers={self.max_workers})")
-        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers)
+        self._executor = _conv_pool()
+        # 進捗シグナルは最大200回程度に間引く。GUIスレッドの setValue/再描画が
+        # 件数に比例しないようにする（エラーと最終件は常に通知）
+        self._progress_stride = max(1, total // 200)
+        # 共通オプションは1回だけ構築して全アイテムで共有する（ワーカー側は
+        # 読み取り専用）。overwrite が共通値と異なる行だけ個別コピーを持つ。
+        base_opts = dict(self.options)
+        base_opts.setdefault("retry_attempts", 3)
+        base_opts.setdefault("backoff_seconds", 0.5)
+        default_overwrite = base_opts.setdefault("overwrite", False)
+        args = []
+        for idx, item in enumerate(self.src_items, start=1):
+            overwrite = item.get("overwrite", default_overwrite)
+            if overwrite == default_overwrite:
+                per_opts = base_opts
+            else:
+                per_opts = dict(base_opts, overwrite=overwrite)
+            args.append((idx, total, item["path"], per_opts, item.get("suffix")))
+        # 1ファイル=1Future だと数千件でキュー競合と Future 生成が支配的になる。
+        # ThreadPoolExecutor.map の chunksize は無視されるので、手動でまとめて
+        # 1バッチ=1Future にし、ワーカーが1回のロック取得で複数件を引き取る。
+        chunksize = max(1, total // (self.max_workers * 4))
+        # バックプレッシャ兼並列度制限: 共有プールは大きめなので、同時に走る
+        # バッチをセマフォで max_workers 本に絞る（スピンボックスの値を尊重）。
+        # 完了コールバックがスロットを返し、完了済み Future はその場で結果を
+        # 回収して手放す。巨大なジョブでもピークメモリはワーカー数に比例する。
+        sem = threading.Semaphore(self.max_workers)
+        results: List[Tuple[str, str, Optional[str]]] = []
+        in_flight: List[concurrent.futures.Future] = []
+
+        def _drain(futures, results):
+            """Collect finished futures' results; return the still-running rest."""
+            remaining = []
+            for fut in futures:
+                if fut.done():
+                    try:
+                        results.extend(fut.result())
+                    except Exception as e:
+                        results.append(("", "", str(e)))
+                else:
+                    remaining.append(fut)
+            return remaining
+
         try:
-            for idx, item in enumerate(self.src_items, start=1):
+            for offset in range(0, total, chunksize):
+                # acquire はタイムアウト付きでループし、キャンセルに即応する
+                while not sem.acquire(timeout=0.2):
+                    if self._stop_event.is_set():
+                        break
                 if self._stop_event.is_set():
                     break
-                src = item["path"]
-                per_opts = dict(self.options)
-                per_opts["overwrite"] = item.get("overwrite", per_opts.get("overwrite", False))
-                per_opts["retry_attempts"] = per_opts.get("retry_attempts", 3)
-                per_opts["backoff_seconds"] = per_opts.get("backoff_seconds", 0.5)
-                future = self._executor.submit(self._run_convert, idx, total, src, per_opts, item.get("suffix"))
-                self._futures.append(future)
-            concurrent.futures.wait(self._futures, return_when=concurrent.futures.ALL_COMPLETED)
+                future = self._executor.submit(self._run_convert_chunk, args[offset:offset + chunksize])
+                future.add_done_callback(lambda f: sem.release())
+                in_flight.append(future)
+                in_flight = _drain(in_flight, results)
+            concurrent.futures.wait(in_flight, return_when=concurrent.futures.ALL_COMPLETED)
         finally:
-            if self._executor:
-                self._executor.shutdown(wait=False)
-            results = []
-            for fut in self._futures:
+            # 共有プールは shutdown しない（次の実行でも使う）
+            for fut in in_flight:
                 try:
-                    results.append(fut.result())
+                    results.extend(fut.result())
                 except Exception as e:
                     results.append(("", "", str(e)))
             self.signals.finished.emit(results)
             self.signals.log.emit("ワーカープール終了")
 
     def stop(self):
+        # 共有プールは止めずに、停止フラグで実行中/未実行のバッチを打ち切る
         self.signals.log.emit("キャンセル要求を受け取りました")
         self._stop_event.set()
-        if self._executor:
-            self._executor.shutdown(wait=False)
+
+    def _run_convert_chunk(self, batch: List[tuple]) -> List[Tuple[str, str, Optional[str]]]:
+        """Run a batch of conversions on one worker; skips remaining items on cancel."""
+        results = []
+        for idx, total, src, opts, suffix in batch:
+            if self._stop_event.is_set():
+                results.append((src, "", "キャンセルされました"))
+                continue
+            results.append(self._run_convert(idx, total, src, opts, suffix))
+        return results
 
     def _run_convert(self, idx: int, total: int, src: str, opts: dict, suffix: Optional[str]) -> Tuple[str, str, Optional[str]]:
         """
@@ -83,7 +157,10 @@ class PoolWorker(QtCore.QObject):
         base_backoff = float(opts.get("backoff_seconds", 0.5))
         attempt = 0
         last_err_text = None
+        # Path と .name の再構築はループ内で繰り返さない
         src_path = Path(src)
+        src_name = src_path.name
+        dst_dir_p = Path(self.dst_dir)
         desired_out_name = None
         try:
             base = src_path.stem
@@ -94,7 +171,7 @@ class PoolWorker(QtCore.QObject):
         while attempt < retry_attempts and not self._stop_event.is_set():
             attempt += 1
             try:
-                self.signals.log.emit(f"[{idx}/{total}] 変換試行 {attempt}/{retry_attempts} - {src_path.name}")
+                self.signals.log.emit(f"[{idx}/{total}] 変換試行 {attempt}/{retry_attempts} - {src_name}")
                 saved = converter.convert_to_jpg(
                     src_path=src,
                     dst_dir=str(self.dst_dir),
@@ -106,7 +183,7 @@ class PoolWorker(QtCore.QObject):
                 saved_path = Path(saved)
                 # rename if suffix requested and saved name differs
                 if desired_out_name and saved_path.name != desired_out_name:
-                    final_dst = Path(self.dst_dir).joinpath(desired_out_name)
+                    final_dst = dst_dir_p.joinpath(desired_out_name)
                     try:
                         if final_dst.exists() and not opts.get("overwrite", False):
                             i = 1
@@ -121,112 +198,162 @@ class PoolWorker(QtCore.QObject):
                         self.signals.log.emit(f"リネーム成功: {saved_path.name} -> {final_dst.name}")
                     except Exception as ex_rename:
                         self.signals.log.emit(f"リネーム失敗: {ex_rename}")
-                # success
-                self.signals.progress.emit(idx, total, src, saved, None)
-                self.signals.log.emit(f"変換成功: {src_path.name} -> {Path(saved).name}")
+                # success (progress coalesced; full results arrive via finished)
+                if idx % self._progress_stride == 0 or idx == total:
+                    self.signals.progress.emit(idx, total, src, saved, None)
+                self.signals.log.emit(f"変換成功: {src_name} -> {Path(saved).name}")
                 return (src, saved, None)
             except Exception as e:
-                err_text = "".join(traceback.format_exception_only(type(e), e)).strip()
+                err_text = f"{type(e).__name__}: {e}"
                 last_err_text = err_text
-                self.signals.log.emit(f"エラー({attempt}/{retry_attempts}): {src_path.name} : {err_text}")
+                self.signals.log.emit(f"エラー({attempt}/{retry_attempts}): {src_name} : {err_text}")
                 # fatal error check (example: PermissionError -> no retry)
                 if isinstance(e, PermissionError):
                     self.signals.log.emit("致命的エラーのためリトライを中止します")
                     break
                 if attempt >= retry_attempts:
                     break
-                # exponential backoff + jitter
-                backoff = base_backoff * (2 ** (attempt - 1))
-                jitter = min(1.0, backoff * 0.1)
-                sleep_time = backoff + (jitter * (0.5 - (time.time() % 1)))
-                time.sleep(sleep_time)
+                # exponential backoff + jitter; Event.wait はキャンセルで即座に
+                # True を返すので、リトライ待ちが stop() を塞がない
+                sleep_time = base_backoff * (2 ** (attempt - 1))
+                sleep_time += random.uniform(0, sleep_time * 0.1)
+                if self._stop_event.wait(sleep_time):
+                    break
                 continue
 
         # final failure after retries
         self.signals.progress.emit(idx, total, src, "", last_err_text or "Unknown error")
-        self.signals.log.emit(f"変換最終失敗: {src_path.name} : {last_err_text}")
+        self.signals.log.emit(f"変換最終失敗: {src_name} : {last_err_text}")
         return (src, "", last_err_text)
 
-# ---------- File row widget (thumbnail + per-item options) ----------
-class FileRowWidget(QtWidgets.QWidget):
-    MAX_SUFFIX_LEN = 32
-    # allowed chars: ASCII letters, digits, hyphen, underscore, dot
-    _SUFFIX_RE = re.compile(r'^[A-Za-z0-9_.\-]*$')
+# ---------- Background thumbnail rendering ----------
+# PIL decode + resample runs on a bounded QThreadPool; only the final
+# QImage/QPixmap construction happens on the GUI thread via a queued signal.
+_THUMB_POOL: Optional[QtCore.QThreadPool] = None
+
+def _thumb_pool() -> QtCore.QThreadPool:
+    global _THUMB_POOL
+    if _THUMB_POOL is None:
+        _THUMB_POOL = QtCore.QThreadPool()
+        _THUMB_POOL.setMaxThreadCount(min(8, os.cpu_count() or 1))
+    return _THUMB_POOL
+
+# Persistent thumbnail cache: same bytes (under any name) render once,
+# repeat runs load a tiny PNG instead of decoding the full image
+_thumb_cache_dir: Optional[Path] = None
+_thumb_cache_failed = False
+# (path, size, mtime_ns) -> content digest, so unchanged files are not re-hashed
+_hash_memo: Dict[tuple, str] = {}
+
+# この閾値未満のファイルはハッシュせず (size, mtime_ns) をそのままキーにする。
+# ローカル利用では size+mtime で十分強く、I/O を丸ごと省ける
+_HASH_MIN_BYTES = 1024 * 1024
+
+def _fast_hash(path: str) -> str:
+    """Content digest over an mmap of the file: XXH3-128 when available
+    (GB/s-class), else BLAKE2b-128. No file bytes are materialized in Python."""
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if HAS_XXHASH:
+                return xxhash.xxh3_128_hexdigest(mm)
+            return hashlib.blake2b(mm, digest_size=16).hexdigest()
+
+def _content_hash(path: str) -> Optional[str]:
+    """Cache key for the file's contents, memoized on (path, size, mtime).
+
+    Small files are keyed by size+mtime alone; larger ones get a real
+    content digest via _fast_hash.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    memo_key = (path, st.st_size, st.st_mtime_ns)
+    digest = _hash_memo.get(memo_key)
+    if digest is not None:
+        return digest
+    if st.st_size < _HASH_MIN_BYTES:
+        # パスの短いダイジェストを混ぜて、同時刻に書かれた同サイズの別ファイル
+        # 同士がキャッシュ名を共有しないようにする
+        path_tag = hashlib.blake2b(path.encode("utf-8", "surrogateescape"),
+                                   digest_size=8).hexdigest()
+        digest = f"{path_tag}s{st.st_size}m{st.st_mtime_ns:x}"
+    else:
+        try:
+            digest = _fast_hash(path)
+        except (OSError, ValueError):
+            return None
+    _hash_memo[memo_key] = digest
+    return digest
+
+def _thumb_cache_path(path: str, tw: int, th: int) -> Optional[Path]:
+    """Cache file for this source at the given thumbnail size, or None."""
+    global _thumb_cache_dir, _thumb_cache_failed
+    if _thumb_cache_failed:
+        return None
+    if _thumb_cache_dir is None:
+        try:
+            d = Path.home() / ".cache" / "ImageToJpgApp" / "thumbs"
+            d.mkdir(parents=True, exist_ok=True)
+            _thumb_cache_dir = d
+        except Exception:
+            _thumb_cache_failed = True
+            return None
+    digest = _content_hash(path)
+    if digest is None:
+        return None
+    return _thumb_cache_dir / f"{digest}_{tw}x{th}.png"
 
-    def __init__(self, path: str, parent=None):
-        super().__init__(parent)
+class ThumbSignals(QtCore.QObject):
+    done = QtCore.pyqtSignal(str, bytes, int, int, str)  # path, pixel bytes, width, height, "RGB"/"RGBA"
+    failed = QtCore.pyqtSignal(str)  # path
+
+class ThumbTask(QtCore.QRunnable):
+    """Render one thumbnail (cache lookup + PIL decode/resample) off the GUI thread."""
+
+    def __init__(self, path: str, tw: int, th: int):
+        super().__init__()
         self.path = path
-        self._build_ui()
-        QtCore.QTimer.singleShot(10, self._generate_thumbnail)
+        self.tw = tw
+        self.th = th
+        self.signals = ThumbSignals()
+        self.setAutoDelete(True)
 
-    def _build_ui(self):
-        h = QtWidgets.QHBoxLayout(self)
-        h.setContentsMargins(4, 4, 4, 4)
-        # thumbnail rectangle (adjustable)
-        self.thumb_width = 96
-        self.thumb_height = 64
-        self.thumb_lbl = QtWidgets.QLabel()
-        self.thumb_lbl.setFixedSize(self.thumb_width, self.thumb_height)
-        self.thumb_lbl.setScaledContents(False)
-        h.addWidget(self.thumb_lbl)
-        # name/path
-        v = QtWidgets.QVBoxLayout()
-        self.lbl_name = QtWidgets.QLabel(Path(self.path).name)
-        self.lbl_path = QtWidgets.QLabel(str(Path(self.path).parent))
-        self.lbl_path.setStyleSheet("color: gray; font-size: 10pt;")
-        v.addWidget(self.lbl_name)
-        v.addWidget(self.lbl_path)
-        h.addLayout(v)
-        # spacer
-        h.addStretch()
-        # per-item options with validation
-        form = QtWidgets.QFormLayout()
-        self.edit_suffix = QtWidgets.QLineEdit("")  # e.g. "_v2"
-        self.edit_suffix.setPlaceholderText("例: _v2  （英数字 _ - . を使用）")
-        self.edit_suffix.textChanged.connect(self._on_suffix_changed)
-        self.chk_overwrite = QtWidgets.QCheckBox("上書き")
-        form.addRow("サフィックス", self.edit_suffix)
-        form.addRow(self.chk_overwrite)
-        h.addLayout(form)
-
-    def _on_suffix_changed(self, text: str):
-        # validate length
-        if len(text) > self.MAX_SUFFIX_LEN:
-            self._set_suffix_invalid(f"長すぎます（最大 {self.MAX_SUFFIX_LEN} 文字）")
-            return
-        # validate allowed chars
-        if not self._SUFFIX_RE.match(text):
-            self._set_suffix_invalid("使用できない文字が含まれています（許可: 英数字, -, _, .）")
-            return
-        # valid
-        self._set_suffix_valid()
-
-    def _set_suffix_invalid(self, reason: str):
-        self.edit_suffix.setStyleSheet("border: 1px solid #d9534f;")  # red border
-        self.edit_suffix.setToolTip(reason)
-
-    def _set_suffix_valid(self):
-        self.edit_suffix.setStyleSheet("")  # reset
-        self.edit_suffix.setToolTip("")
-
-    def sanitize_suffix(self, text: str) -> str:
-        """Return sanitized suffix, removing disallowed chars and trimming length."""
-        # keep allowed characters only
-        sanitized_chars = [ch for ch in text if self._SUFFIX_RE.match(ch)]
-        sanitized = "".join(sanitized_chars)
-        if len(sanitized) > self.MAX_SUFFIX_LEN:
-            sanitized = sanitized[: self.MAX_SUFFIX_LEN]
-        return sanitized
-
-    def _generate_thumbnail(self):
-        """Create a rectangular thumbnail with preserved aspect ratio and background fill."""
+    def run(self):
+        try:
+            data, w, h, fmt = self._render()
+            self.signals.done.emit(self.path, data, w, h, fmt)
+        except Exception:
+            try:
+                self.signals.failed.emit(self.path)
+            except RuntimeError:
+                # receiver torn down while the task was in flight; signals object gone
+                pass
+
+    def _render(self) -> Tuple[bytes, int, int, str]:
+        from PIL import Image, ImageOps
+        tw, th = self.tw, self.th
+        cache_path = _thumb_cache_path(self.path, tw, th)
+        if cache_path is not None and cache_path.exists():
+            with Image.open(cache_path) as cached:
+                mode = "RGB" if cached.mode == "RGB" else "RGBA"
+                bg = cached.convert(mode)
+            return bg.tobytes("raw", mode), bg.width, bg.height, mode
+        img = Image.open(self.path)
         try:
-            from PIL import Image, ImageOps
-            img = Image.open(self.path)
-            # target rectangle
-            tw, th = self.thumb_width, self.thumb_height
-            img = ImageOps.exif_transpose(img)
-            img.thumbnail((tw, th), Image.LANCZOS)
+            # JPEG の DCT スケーリングで 1/2〜1/8 サイズのまま展開する。
+            # draft は load 前でなければ効かないので exif_transpose より先。
+            img.draft("RGB", (tw * 8, th * 8))
+        except Exception:
+            pass
+        img = ImageOps.exif_transpose(img)
+        # サムネイルに LANCZOS は過剰; BILINEAR で十分かつ速い
+        img.thumbnail((tw, th), Image.BILINEAR)
+        if img.size == (tw, th) and img.mode in ("RGB", "L", "1"):
+            # 不透明かつ矩形ぴったり: 背景合成もRGBA化も不要
+            bg = img if img.mode == "RGB" else img.convert("RGB")
+            mode = "RGB"
+        else:
             # Create background and paste centered
             bg = Image.new("RGBA", (tw, th), (240, 240, 240, 255))
             x = (tw - img.width) // 2
@@ -234,35 +361,214 @@ class FileRowWidget(QtWidgets.QWidget):
             if img.mode != "RGBA":
                 img = img.convert("RGBA")
             bg.paste(img, (x, y), img if "A" in img.mode else None)
-            data = bg.tobytes("raw", "RGBA")
-            qimg = QtGui.QImage(data, bg.width, bg.height, QtGui.QImage.Format_RGBA8888)
-            pix = QtGui.QPixmap.fromImage(qimg)
-            self.thumb_lbl.setPixmap(pix)
-            try:
-                img.close()
-            except Exception:
-                pass
+            mode = "RGBA"
+        if bg is not img:
+            img.close()
+        if cache_path is not None:
+            # write-then-rename keeps the cache atomic
             try:
-                bg.close()
+                tmp = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+                bg.save(tmp, "PNG", optimize=False)
+                os.replace(tmp, cache_path)
             except Exception:
                 pass
-        except Exception:
-            icon = self.style().standardIcon(QtWidgets.QStyle.SP_FileIcon)
-            pix = icon.pixmap(self.thumb_width, self.thumb_height)
-            self.thumb_lbl.setPixmap(pix)
-
-    def get_options(self) -> Dict:
-        # sanitize suffix before returning options
-        raw_suffix = self.edit_suffix.text().strip()
-        safe_suffix = self.sanitize_suffix(raw_suffix)
-        if safe_suffix != raw_suffix:
-            # reflect sanitized value back to UI (non-blocking)
-            self.edit_suffix.setText(safe_suffix)
-        return {
-            "path": self.path,
-            "suffix": safe_suffix,
-            "overwrite": self.chk_overwrite.isChecked(),
-        }
+        return bg.tobytes("raw", mode), bg.width, bg.height, mode
+
+# ---------- Per-item suffix rules (shared by the delegate editor and option collection) ----------
+MAX_SUFFIX_LEN = 32
+# complement of the allowed set (ASCII letters, digits, hyphen, underscore, dot)
+_SUFFIX_DROP = re.compile(r'[^A-Za-z0-9_.-]')
+
+def sanitize_suffix(text: str) -> str:
+    """Return sanitized suffix, removing disallowed chars and trimming length."""
+    # one compiled sub() instead of a regex match per character
+    return _SUFFIX_DROP.sub("", text)[:MAX_SUFFIX_LEN]
+
+# ---------- File list model/delegate (one dict per row, no per-row widgets) ----------
+class FileListModel(QtCore.QAbstractListModel):
+    """List of files to convert.
+
+    1行 = dict {path, suffix, overwrite, thumb_pixmap} だけを保持する。
+    QWidget ツリーを行ごとに作らないので、数千件でもメモリは辞書+Pixmap分で
+    済み、描画はデリゲートが可視行だけ行う。
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Dict] = []
+        self._row_by_path: Dict[str, int] = {}
+
+    # --- Qt model API ---
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        if role == QtCore.Qt.DisplayRole:
+            return os.path.basename(row["path"])
+        if role == QtCore.Qt.DecorationRole:
+            return row["thumb_pixmap"]
+        if role == QtCore.Qt.EditRole:
+            return row["suffix"]
+        if role == QtCore.Qt.CheckStateRole:
+            return QtCore.Qt.Checked if row["overwrite"] else QtCore.Qt.Unchecked
+        if role in (QtCore.Qt.ToolTipRole, QtCore.Qt.UserRole):
+            return row["path"]
+        return None
+
+    def setData(self, index, value, role=QtCore.Qt.EditRole):
+        if not index.isValid():
+            return False
+        row = self._rows[index.row()]
+        if role == QtCore.Qt.EditRole:
+            row["suffix"] = sanitize_suffix(str(value).strip())
+        elif role == QtCore.Qt.CheckStateRole:
+            row["overwrite"] = value == QtCore.Qt.Checked
+        else:
+            return False
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index):
+        return (QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+                | QtCore.Qt.ItemIsEditable | QtCore.Qt.ItemIsUserCheckable)
+
+    # --- app API ---
+    def add_paths(self, paths) -> List[str]:
+        """Insert unseen paths in one rowsInserted; returns the added paths."""
+        new_paths = []
+        for p in paths:
+            if p and p not in self._row_by_path:
+                self._row_by_path[p] = len(self._rows) + len(new_paths)
+                new_paths.append(p)
+        if not new_paths:
+            return []
+        first = len(self._rows)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(new_paths) - 1)
+        for p in new_paths:
+            self._rows.append({"path": p, "suffix": "", "overwrite": False, "thumb_pixmap": None})
+        self.endInsertRows()
+        return new_paths
+
+    def remove_rows(self, rows):
+        for r in sorted(set(rows), reverse=True):
+            self.beginRemoveRows(QtCore.QModelIndex(), r, r)
+            removed = self._rows.pop(r)
+            self.endRemoveRows()
+            self._row_by_path.pop(removed["path"], None)
+        self._row_by_path = {row["path"]: i for i, row in enumerate(self._rows)}
+
+    def clear(self):
+        self.beginResetModel()
+        self._rows = []
+        self._row_by_path = {}
+        self.endResetModel()
+
+    def set_thumbnail(self, path: str, pixmap: QtGui.QPixmap):
+        i = self._row_by_path.get(path)
+        if i is None:
+            return
+        self._rows[i]["thumb_pixmap"] = pixmap
+        idx = self.index(i)
+        self.dataChanged.emit(idx, idx, [QtCore.Qt.DecorationRole])
+
+    def rows(self) -> List[Dict]:
+        return self._rows
+
+class FileRowDelegate(QtWidgets.QStyledItemDelegate):
+    """Paint thumbnail + name + suffix + overwrite checkbox per row.
+
+    サフィックスはダブルクリックでインライン編集（QLineEdit）、上書きは右端の
+    チェックボックスで切り替える。
+    """
+
+    THUMB_W = 96
+    THUMB_H = 64
+    ROW_H = 88
+    CHECK_W = 20
+
+    def sizeHint(self, option, index):
+        return QtCore.QSize(520, self.ROW_H)
+
+    def paint(self, painter, option, index):
+        opt = QtWidgets.QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        style = opt.widget.style() if opt.widget else QtWidgets.QApplication.style()
+        # 背景（選択・ホバー）だけ描かせ、中身は自前で描く
+        opt.text = ""
+        opt.icon = QtGui.QIcon()
+        style.drawPrimitive(QtWidgets.QStyle.PE_PanelItemViewItem, opt, painter, opt.widget)
+
+        r = option.rect
+        pm = index.data(QtCore.Qt.DecorationRole)
+        thumb_rect = QtCore.QRect(r.x() + 4, r.y() + (r.height() - self.THUMB_H) // 2,
+                                  self.THUMB_W, self.THUMB_H)
+        if isinstance(pm, QtGui.QPixmap) and not pm.isNull():
+            painter.drawPixmap(thumb_rect.x() + (self.THUMB_W - pm.width()) // 2,
+                               thumb_rect.y() + (self.THUMB_H - pm.height()) // 2, pm)
+
+        path = index.data(QtCore.Qt.UserRole) or ""
+        suffix = index.data(QtCore.Qt.EditRole) or ""
+        text_x = thumb_rect.right() + 10
+        text_w = r.right() - self.CHECK_W - 12 - text_x
+        painter.save()
+        painter.drawText(QtCore.QRect(text_x, r.y() + 8, text_w, 20),
+                         QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter,
+                         index.data(QtCore.Qt.DisplayRole) or "")
+        small = painter.font()
+        small.setPointSize(max(7, small.pointSize() - 1))
+        painter.setFont(small)
+        painter.setPen(QtGui.QColor("gray"))
+        painter.drawText(QtCore.QRect(text_x, r.y() + 30, text_w, 18),
+                         QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter,
+                         os.path.dirname(path))
+        painter.drawText(QtCore.QRect(text_x, r.y() + 52, text_w, 18),
+                         QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter,
+                         f"サフィックス: {suffix}" if suffix else "サフィックス: （ダブルクリックで編集）")
+        painter.restore()
+
+        cb = QtWidgets.QStyleOptionButton()
+        cb.rect = self._check_rect(r)
+        cb.text = "上書き"
+        cb.state = QtWidgets.QStyle.State_Enabled
+        cb.state |= (QtWidgets.QStyle.State_On
+                     if index.data(QtCore.Qt.CheckStateRole) == QtCore.Qt.Checked
+                     else QtWidgets.QStyle.State_Off)
+        style.drawControl(QtWidgets.QStyle.CE_CheckBox, cb, painter, opt.widget)
+
+    def _check_rect(self, r: QtCore.QRect) -> QtCore.QRect:
+        return QtCore.QRect(r.right() - self.CHECK_W - 60,
+                            r.y() + (r.height() - self.CHECK_W) // 2,
+                            self.CHECK_W + 56, self.CHECK_W)
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QtCore.QEvent.MouseButtonRelease
+                and self._check_rect(option.rect).contains(event.pos())):
+            cur = index.data(QtCore.Qt.CheckStateRole)
+            model.setData(index,
+                          QtCore.Qt.Unchecked if cur == QtCore.Qt.Checked else QtCore.Qt.Checked,
+                          QtCore.Qt.CheckStateRole)
+            return True
+        return super().editorEvent(event, model, option, index)
+
+    def createEditor(self, parent, option, index):
+        edit = QtWidgets.QLineEdit(parent)
+        edit.setPlaceholderText("例: _v2  （英数字 _ - . を使用）")
+        edit.setMaxLength(MAX_SUFFIX_LEN)
+        return edit
+
+    def setEditorData(self, editor, index):
+        editor.setText(index.data(QtCore.Qt.EditRole) or "")
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.text(), QtCore.Qt.EditRole)
+
+    def updateEditorGeometry(self, editor, option, index):
+        r = option.rect
+        editor.setGeometry(QtCore.QRect(r.x() + self.THUMB_W + 14, r.bottom() - 26,
+                                        max(140, r.width() - self.THUMB_W - self.CHECK_W - 90), 22))
 
 # ---------- MainWindow ----------
 class MainWindow(QtWidgets.QMainWindow):
@@ -271,12 +577,18 @@ class MainWindow(QtWidgets.QMainWindow):
         self.setWindowTitle("ImageToJpgApp (詳細版)")
         self._worker_thread: Optional[QtCore.QThread] = None
         self._pool_worker: Optional[PoolWorker] = None
-        self._ui_log_queue: Optional[queue.Queue] = None
-        self._ui_logger_thread: Optional[threading.Thread] = None
+        self._qt_log_handler: Optional[QtLogHandler] = None
         self.logger = None
         self._first_show = True
         self._build_ui()
         self._connect_signals()
+        # ログ行はバッファに溜めて50msごとにまとめて描画する
+        # （1行ごとの appendPlainText はレイアウトパスが多すぎる）
+        self._log_buf: collections.deque = collections.deque()
+        self._log_timer = QtCore.QTimer(self)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._log_timer.start()
         # 初期ウィンドウサイズ指定（showEventで中央化されます）
         self.resize(1100, 673)
 
@@ -344,10 +656,15 @@ class MainWindow(QtWidgets.QMainWindow):
         # left: list
         left_widget = QtWidgets.QWidget()
         left_v = QtWidgets.QVBoxLayout(left_widget)
-        self.list_widget = QtWidgets.QListWidget()
-        self.list_widget.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
-        self.list_widget.setDragDropMode(QtWidgets.QAbstractItemView.DropOnly)
-        left_v.addWidget(self.list_widget)
+        self.file_model = FileListModel(self)
+        self.list_view = QtWidgets.QListView()
+        self.list_view.setModel(self.file_model)
+        self.list_view.setItemDelegate(FileRowDelegate(self.list_view))
+        self.list_view.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        self.list_view.setDragDropMode(QtWidgets.QAbstractItemView.DropOnly)
+        self.list_view.setEditTriggers(QtWidgets.QAbstractItemView.DoubleClicked)
+        self.list_view.setUniformItemSizes(True)
+        left_v.addWidget(self.list_view)
         splitter.addWidget(left_widget)
 
         # right: settings + log
@@ -399,6 +716,8 @@ class MainWindow(QtWidgets.QMainWindow):
         right_v.addWidget(QtWidgets.QLabel("ログ"))
         self.log_view = QtWidgets.QPlainTextEdit()
         self.log_view.setReadOnly(True)
+        # bound memory on long runs
+        self.log_view.setMaximumBlockCount(5000)
         right_v.addWidget(self.log_view)
 
         action_h = QtWidgets.QHBoxLayout()
@@ -414,8 +733,8 @@ class MainWindow(QtWidgets.QMainWindow):
         splitter.setSizes([600, 300])
 
         # drag & drop
-        self.list_widget.viewport().setAcceptDrops(True)
-        self.list_widget.installEventFilter(self)
+        self.list_view.viewport().setAcceptDrops(True)
+        self.list_view.installEventFilter(self)
 
     def _connect_signals(self):
         self.btn_add.clicked.connect(self.on_add_files)
@@ -425,35 +744,55 @@ class MainWindow(QtWidgets.QMainWindow):
         self.btn_bgcolor.clicked.connect(self.on_select_bg)
         self.btn_convert.clicked.connect(self.on_start)
         self.btn_cancel.clicked.connect(self.on_cancel)
-        self.list_widget.itemDoubleClicked.connect(self.on_item_double_clicked)
 
     # ---------- File list helpers ----------
     def add_file_row(self, path: str):
-        for i in range(self.list_widget.count()):
-            if self.list_widget.item(i).data(QtCore.Qt.UserRole) == path:
-                return
-        item = QtWidgets.QListWidgetItem()
-        item.setSizeHint(QtCore.QSize(520, 88))
-        item.setData(QtCore.Qt.UserRole, path)
-        widget = FileRowWidget(path)
-        self.list_widget.addItem(item)
-        self.list_widget.setItemWidget(item, widget)
+        self._add_files_bulk([path])
 
     def on_add_files(self):
         files, _ = QtWidgets.QFileDialog.getOpenFileNames(
             self, "画像を選択", str(Path.home()),
             "Images (*.png *.jpg *.jpeg *.gif *.tif *.tiff *.psd *.svg *.webp *.heic *.raw *.cr2 *.nef *.arw)"
         )
-        for f in files:
-            self.add_file_row(f)
+        self._add_files_bulk(files)
+
+    def _add_files_bulk(self, paths):
+        """Insert rows with a single model operation; duplicates are skipped
+        by the model, and each new row gets its thumbnail queued."""
+        added = self.file_model.add_paths(paths)
+        for p in added:
+            self._start_thumbnail_task(p)
+
+    def _start_thumbnail_task(self, path: str):
+        """Queue the PIL thumbnail work on the shared pool; results are routed
+        back to the model by path via queued signal connections."""
+        task = ThumbTask(path, FileRowDelegate.THUMB_W, FileRowDelegate.THUMB_H)
+        task.signals.done.connect(self._on_thumb_ready, QtCore.Qt.QueuedConnection)
+        task.signals.failed.connect(self._on_thumb_failed, QtCore.Qt.QueuedConnection)
+        _thumb_pool().start(task)
+
+    @QtCore.pyqtSlot(str, bytes, int, int, str)
+    def _on_thumb_ready(self, path: str, data: bytes, w: int, h: int, fmt: str):
+        # QImage はバッファを参照するだけ（ストライド明示）。QPixmap.fromImage が
+        # 唯一のピクセルコピーで、以後バッファは不要になる
+        if fmt == "RGB":
+            qimg = QtGui.QImage(data, w, h, 3 * w, QtGui.QImage.Format_RGB888)
+        else:
+            qimg = QtGui.QImage(data, w, h, 4 * w, QtGui.QImage.Format_RGBA8888)
+        self.file_model.set_thumbnail(path, QtGui.QPixmap.fromImage(qimg))
+
+    @QtCore.pyqtSlot(str)
+    def _on_thumb_failed(self, path: str):
+        icon = self.style().standardIcon(QtWidgets.QStyle.SP_FileIcon)
+        self.file_model.set_thumbnail(
+            path, icon.pixmap(FileRowDelegate.THUMB_W, FileRowDelegate.THUMB_H))
 
     def on_remove_files(self):
-        for item in self.list_widget.selectedItems():
-            row = self.list_widget.row(item)
-            self.list_widget.takeItem(row)
+        rows = [idx.row() for idx in self.list_view.selectionModel().selectedIndexes()]
+        self.file_model.remove_rows(rows)
 
     def on_clear(self):
-        self.list_widget.clear()
+        self.file_model.clear()
 
     def on_browse(self):
         d = QtWidgets.QFileDialog.getExistingDirectory(self, "出力フォルダを選択", self.out_edit.text())
@@ -465,43 +804,30 @@ class MainWindow(QtWidgets.QMainWindow):
         if col.isValid():
             self.lbl_bg.setText(col.name())
 
-    def on_item_double_clicked(self, item: QtWidgets.QListWidgetItem):
-        pass
-
     def eventFilter(self, obj, event):
-        if obj is self.list_widget and event.type() == QtCore.QEvent.Drop:
+        if obj is self.list_view and event.type() == QtCore.QEvent.Drop:
             mime = event.mime()
             if mime.hasUrls():
-                for u in mime.urls():
-                    path = u.toLocalFile()
-                    if path:
-                        self.add_file_row(path)
+                paths = [u.toLocalFile() for u in mime.urls()]
+                self._add_files_bulk([p for p in paths if p])
             return True
         return super().eventFilter(obj, event)
 
     # ---------- Start / Cancel ----------
     def on_start(self):
-        # Sanitize suffixes across the list before collection
+        # サフィックスの自動修正とオプション収集を1回の走査で行う
         fixed_count = 0
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            widget = self.list_widget.itemWidget(item)
-            if hasattr(widget, "sanitize_suffix"):
-                raw = widget.edit_suffix.text().strip()
-                cleaned = widget.sanitize_suffix(raw)
-                if cleaned != raw:
-                    widget.edit_suffix.setText(cleaned)
-                    fixed_count += 1
-                    self.append_log(f"サフィックスを自動修正: {raw} -> {cleaned}")
+        src_items = []
+        for i, row in enumerate(self.file_model.rows()):
+            raw = row["suffix"]
+            cleaned = sanitize_suffix(raw.strip())
+            if cleaned != raw:
+                self.file_model.setData(self.file_model.index(i), cleaned, QtCore.Qt.EditRole)
+                fixed_count += 1
+                self.append_log(f"サフィックスを自動修正: {raw} -> {cleaned}")
+            src_items.append({"path": row["path"], "suffix": cleaned, "overwrite": row["overwrite"]})
         if fixed_count:
             self.append_log(f"{fixed_count} 件のサフィックスを自動修正しました")
-
-        src_items = []
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            widget = self.list_widget.itemWidget(item)
-            opts = widget.get_options()
-            src_items.append(opts)
         if not src_items:
             QtWidgets.QMessageBox.warning(self, "警告", "変換するファイルを追加してください")
             return
@@ -513,20 +839,14 @@ class MainWindow(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.critical(self, "エラー", f"出力フォルダを作成できません: {e}")
             return
 
-        # Prepare logger and UI queue
+        # Prepare logger; the Qt handler pushes records into the log view via
+        # a queued signal connection (thread-safe), replacing the old
+        # queue + polling-thread arrangement
         log_path = os.path.join(dst_dir, "ImageToJpgApp.log")
-        self._ui_log_queue = queue.Queue()
-        self.logger = setup_logger("ImageToJpgApp", logfile=log_path, ui_queue=self._ui_log_queue)
-
-        def _ui_log_poller():
-            while getattr(self, "_pool_worker", None) is not None or not self._ui_log_queue.empty():
-                try:
-                    msg = self._ui_log_queue.get(timeout=0.5)
-                except queue.Empty:
-                    continue
-                QtCore.QMetaObject.invokeMethod(self, "append_log", QtCore.Qt.QueuedConnection, QtCore.Q_ARG(str, msg))
-        self._ui_logger_thread = threading.Thread(target=_ui_log_poller, daemon=True)
-        self._ui_logger_thread.start()
+        if self._qt_log_handler is None:
+            self._qt_log_handler = QtLogHandler()
+            self._qt_log_handler.log_emitted.connect(self.append_log, QtCore.Qt.QueuedConnection)
+        self.logger = setup_logger("ImageToJpgApp", logfile=log_path, ui_handler=self._qt_log_handler)
 
         bg_color = QtGui.QColor(self.lbl_bg.text()) if QtGui.QColor(self.lbl_bg.text()).isValid() else QtGui.QColor(255, 255, 255)
         background = (bg_color.red(), bg_color.green(), bg_color.blue())
@@ -569,14 +889,18 @@ class MainWindow(QtWidgets.QMainWindow):
     # ---------- Slots ----------
     def _on_progress(self, idx, total, src, dst, error):
         self.progress.setValue(idx)
+        # os.path.basename は Path(...).name よりずっと軽い（C実装・パース無し）
+        src_name = os.path.basename(src)
         if error:
-            self.append_log(f"失敗: {Path(src).name} : {error}")
+            msg = f"失敗: {src_name} : {error}"
+            self.append_log(msg)
             if self.logger:
-                self.logger.warning(f"失敗: {Path(src).name} : {error}")
+                self.logger.warning(msg)
         else:
-            self.append_log(f"{idx}/{total} 完了: {Path(src).name} -> {Path(dst).name}")
+            msg = f"{idx}/{total} 完了: {src_name} -> {os.path.basename(dst)}"
+            self.append_log(msg)
             if self.logger:
-                self.logger.info(f"{idx}/{total} 完了: {Path(src).name} -> {Path(dst).name}")
+                self.logger.info(msg)
 
     def _on_finished(self, results):
         self.append_log("全タスク終了")
@@ -600,6 +924,16 @@ class MainWindow(QtWidgets.QMainWindow):
 
     @QtCore.pyqtSlot(str)
     def append_log(self, text: str):
-        self.log_view.appendPlainText(text)
+        # buffered; _log_timer flushes batches to the view
+        self._log_buf.append(text)
+
+    def _flush_log(self):
+        if not self._log_buf:
+            return
+        lines = []
+        while self._log_buf:
+            lines.append(self._log_buf.popleft())
+        # one text-document edit and one layout pass per flush interval
+        self.log_view.appendPlainText("\n".join(lines))
         sb = self.log_view.verticalScrollBar()
         sb.setValue(sb.maximum())
@@ -2,6 +2,7 @@
 # Entry point for the ImageToJpgApp GUI
 # Requires: PyQt5
 
+import functools
 import sys
 import os
 from pathlib import Path
@@ -15,6 +16,12 @@ def resource_path(rel_path: str) -> str:
     base = Path(__file__).resolve().parents[2]
     return str(base.joinpath(rel_path))
 
+@functools.lru_cache(maxsize=4)
+def _load_qss(path: str, mtime: float) -> str:
+    """Read a stylesheet once per (path, mtime); repeat loads hit the cache."""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
 def main():
     app = QtWidgets.QApplication(sys.argv)
     app.setApplicationName(APP_NAME)
@@ -22,8 +29,7 @@ def main():
     # Optional: load QSS theme
     qss_path = resource_path("resources/styles/theme.qss")
     if os.path.exists(qss_path):
-        with open(qss_path, "r", encoding="utf-8") as f:
-            app.setStyleSheet(f.read())
+        app.setStyleSheet(_load_qss(qss_path, os.path.getmtime(qss_path)))
 
     window = MainWindow()
     window.resize(800, 500)
@@ -1,33 +1,43 @@
 # app/utils/logging.py
 import logging
-from logging.handlers import RotatingFileHandler
 import queue
-import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Callable, Optional
 
+from PyQt5 import QtCore
+
 DEFAULT_LOGFILE = "ImageToJpgApp.log"
 MAX_BYTES = 5 * 1024 * 1024
 BACKUP_COUNT = 5
 
-# A simple thread-safe queue-based handler for UI consumption
-class QueueHandler(logging.Handler):
-    def __init__(self, q: queue.Queue):
-        super().__init__()
-        self.queue = q
+# Handler that forwards formatted records as a Qt signal. Emitting from a
+# worker thread is safe: connections into the GUI thread are queued by Qt,
+# so no polling thread or hand-rolled queue is needed.
+class QtLogHandler(QtCore.QObject, logging.Handler):
+    log_emitted = QtCore.pyqtSignal(str)
+
+    def __init__(self):
+        QtCore.QObject.__init__(self)
+        logging.Handler.__init__(self)
 
     def emit(self, record):
         try:
-            msg = self.format(record)
-            self.queue.put_nowait(msg)
+            self.log_emitted.emit(self.format(record))
         except Exception:
             self.handleError(record)
 
-def setup_logger(app_name: str = "ImageToJpgApp", logfile: Optional[str] = None, ui_queue: Optional[queue.Queue] = None) -> logging.Logger:
+def setup_logger(app_name: str = "ImageToJpgApp", logfile: Optional[str] = None, ui_handler: Optional[logging.Handler] = None) -> logging.Logger:
     """
     Configure and return a logger used by the application.
 
     - logfile: path to log file (if None, default in cwd used).
-    - ui_queue: if provided, a Queue object; logs are forwarded to it for UI display.
+    - ui_handler: if provided, an extra handler (e.g. QtLogHandler) that
+      receives records for UI display.
+
+    Worker threads see only a QueueHandler, so a log call is an O(1)
+    queue put; a single QueueListener thread drains the queue into the
+    console/file/UI handlers, keeping handler locks and disk I/O off the
+    conversion workers.
     """
     logger = logging.getLogger(app_name)
     logger.setLevel(logging.DEBUG)
@@ -43,21 +53,27 @@ def setup_logger(app_name: str = "ImageToJpgApp", logfile: Optional[str] = None,
     ch = logging.StreamHandler()
     ch.setLevel(logging.INFO)
     ch.setFormatter(fmt)
-    logger.addHandler(ch)
 
     # Rotating file handler (DEBUG+)
     lf = logfile or DEFAULT_LOGFILE
     fh = RotatingFileHandler(lf, maxBytes=MAX_BYTES, backupCount=BACKUP_COUNT, encoding="utf-8")
     fh.setLevel(logging.DEBUG)
     fh.setFormatter(fmt)
-    logger.addHandler(fh)
-
-    # Optional UI queue handler (DEBUG+)
-    if ui_queue is not None:
-        qh = QueueHandler(ui_queue)
-        qh.setLevel(logging.DEBUG)
-        qh.setFormatter(fmt)
-        logger.addHandler(qh)
+
+    sinks = [ch, fh]
+
+    # Optional UI handler (DEBUG+)
+    if ui_handler is not None:
+        ui_handler.setLevel(logging.DEBUG)
+        ui_handler.setFormatter(fmt)
+        sinks.append(ui_handler)
+
+    log_q: queue.Queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_q))
+    listener = QueueListener(log_q, *sinks, respect_handler_level=True)
+    listener.start()
+    # keep a reference so the listener thread isn't GC'd with the locals
+    logger._listener = listener
 
     # avoid duplicate propagation
     logger.propagate = False
@@ -0,0 +1,35 @@
+from pathlib import Path
+
+from PIL import Image
+
+from app.core.converter import convert_to_jpg, _ensure_rgb_for_jpeg
+
+
+def test_ensure_rgb_returns_rgb_image_unchanged():
+    img = Image.new("RGB", (8, 8), (10, 20, 30))
+    assert _ensure_rgb_for_jpeg(img, (255, 255, 255)) is img
+
+
+def test_ensure_rgb_composites_alpha():
+    img = Image.new("RGBA", (8, 8), (200, 100, 0, 0))
+    out = _ensure_rgb_for_jpeg(img, (1, 2, 3))
+    assert out.mode == "RGB"
+    assert out.getpixel((0, 0)) == (1, 2, 3)
+
+
+def test_convert_to_jpg_basic(tmp_path):
+    src = tmp_path / "a.png"
+    Image.new("RGB", (16, 16), (5, 5, 5)).save(src)
+    saved = convert_to_jpg(str(src), str(tmp_path / "out"))
+    assert Path(saved).name == "a.jpg"
+    with Image.open(saved) as img:
+        assert img.format == "JPEG"
+
+
+def test_convert_to_jpg_collision_suffix(tmp_path):
+    src = tmp_path / "a.png"
+    Image.new("RGB", (16, 16)).save(src)
+    first = convert_to_jpg(str(src), str(tmp_path))
+    second = convert_to_jpg(str(src), str(tmp_path))
+    assert Path(first).name == "a.jpg"
+    assert Path(second).name == "a_1.jpg"